@@ -0,0 +1,108 @@
+"""Persistent on-disk cache of raw WMS responses.
+
+Responses are stored in a SQLite database under `$XDG_CACHE_HOME/dovwms`
+(`~/.cache/dovwms` by default), keyed by a hash of the request URL, so a
+query that was answered before is served without network access, even in
+a new process. Expired responses are deleted the first time a process
+opens the cache. Set `DOVWMS_CACHE_DIR` to use another directory, or
+`DOVWMS_NO_CACHE=1` to disable the cache. Deleting the directory clears
+the cache.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Final, Optional
+
+logger = logging.getLogger(__name__)
+
+#: Seconds a cached response stays valid.
+EXPIRE_AFTER: Final = 30 * 86400
+
+
+def _enabled() -> bool:
+    return os.environ.get("DOVWMS_NO_CACHE", "") in ("", "0")
+
+
+def _cache_dir() -> Path:
+    if "DOVWMS_CACHE_DIR" in os.environ:
+        return Path(os.environ["DOVWMS_CACHE_DIR"])
+    return Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "dovwms"
+
+
+# Databases whose schema has been set up (and expired rows purged) by this process
+_initialized: set[Path] = set()
+
+
+def _connect() -> sqlite3.Connection:
+    path = _cache_dir() / "responses.sqlite"
+    if path in _initialized:
+        return sqlite3.connect(path, timeout=5)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path, timeout=5)
+    with connection:
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, created REAL NOT NULL, content BLOB NOT NULL)"
+        )
+        connection.execute("DELETE FROM responses WHERE created < ?", (time.time() - EXPIRE_AFTER,))
+    _initialized.add(path)
+    return connection
+
+
+def _key(url: str) -> str:
+    return hashlib.blake2b(url.encode(), digest_size=20).hexdigest()
+
+
+def load(url: str) -> Optional[bytes]:
+    """Return the cached response for a request URL.
+
+    Arguments:
+        url: Full request URL
+
+    Returns:
+        The cached response body, or None if it is missing, expired, or the cache is disabled
+    """
+    if not _enabled():
+        return None
+    try:
+        with closing(_connect()) as connection:
+            row = connection.execute("SELECT created, content FROM responses WHERE key = ?", (_key(url),)).fetchone()
+    except (OSError, sqlite3.Error):
+        logger.warning("Response cache is unavailable", exc_info=True)
+        return None
+    if row is None or time.time() - row[0] > EXPIRE_AFTER:
+        return None
+    return bytes(row[1])
+
+
+def store(url: str, content: bytes) -> None:
+    """Cache the response for a request URL.
+
+    Arguments:
+        url: Full request URL
+        content: Response body
+    """
+    if not _enabled():
+        return
+    try:
+        with closing(_connect()) as connection, connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, created, content) VALUES (?, ?, ?)",
+                (_key(url), time.time(), content),
+            )
+    except (OSError, sqlite3.Error):
+        logger.warning("Could not write to the response cache", exc_info=True)
+
+
+def clear() -> None:
+    """Remove all cached responses."""
+    try:
+        with closing(_connect()) as connection, connection:
+            connection.execute("DELETE FROM responses")
+    except (OSError, sqlite3.Error):
+        logger.warning("Could not clear the response cache", exc_info=True)
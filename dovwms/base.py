@@ -5,17 +5,60 @@
 """Base classes for API clients."""
 
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Optional
+from collections.abc import Iterable, Sequence
+from functools import cache
+from typing import Any, Callable, ClassVar, Optional
+from urllib.parse import parse_qs, quote, urlencode, urlsplit
 
+import requests
+from owslib.crs import Crs
 from owslib.wms import WebMapService
+from requests.adapters import HTTPAdapter
+
+from dovwms import _cache
 
 logger = logging.getLogger(__name__)
 
+# Process-wide cache of parsed GetCapabilities documents, keyed by (wms_url, wms_version).
+# Values are (WebMapService, monotonic creation time) so entries can expire.
+_WMS_CACHE: dict[tuple[str, str], tuple[WebMapService, float]] = {}
+_WMS_CACHE_LOCK = threading.Lock()
+# One lock per cache key, held while the capabilities are fetched, so concurrent
+# clients wait for a single download instead of each starting their own.
+_WMS_CONNECT_LOCKS: dict[tuple[str, str], threading.Lock] = {}
+
+# Shared HTTP session for GetFeatureInfo requests, so connections (and TLS handshakes)
+# are reused across calls, clients and the worker threads of batched fetches.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+
+@cache
+def _requested_info_format(template: str) -> Optional[str]:
+    """Return the INFO_FORMAT a GetFeatureInfo URL template asks for, if any."""
+    values = parse_qs(urlsplit(template).query).get("INFO_FORMAT")
+    return values[0] if values else None
+
+
+@cache
+def _has_yx_axis_order(crs: str) -> bool:
+    """Check whether WMS 1.3.0 expects the BBOX of this CRS in (y, x) order, as for EPSG:4326."""
+    return Crs(crs).axisorder == "yx"
+
 
 class WMSClient(ABC):
     """Abstract base class for WMS service clients."""
 
+    #: Seconds a cached GetCapabilities document stays valid. None means it never expires.
+    capabilities_ttl: ClassVar[Optional[float]] = None
+
+    #: Timeout in seconds for GetFeatureInfo requests.
+    request_timeout: ClassVar[float] = 30
+
     def __init__(self, base_url: str, wms_version: str = "1.3.0"):
         """Initialize the WMS client.
 
@@ -28,7 +71,9 @@ class WMSClient(ABC):
         """
         self.base_url = base_url
         self.wms_version = wms_version
+        self.wms_url = base_url if base_url.endswith("/wms") else f"{base_url}/wms"
         self._wms: Optional[WebMapService] = None
+        self._layer_names: Optional[frozenset[str]] = None
 
     @property
     def wms(self) -> WebMapService:
@@ -44,22 +89,56 @@ class WMSClient(ABC):
         The setter allows injecting a mock WMS for testing.
         """
         self._wms = value
+        self._reset_layer_caches()
+
+    def _reset_layer_caches(self) -> None:
+        """Forget everything derived from the capabilities of the current connection.
+
+        Subclasses that memoize more layer information should extend this.
+        """
+        self._layer_names = None
+
+    @classmethod
+    def invalidate_cache(cls) -> None:
+        """Drop all cached GetCapabilities documents so the next connection refetches them."""
+        with _WMS_CACHE_LOCK:
+            _WMS_CACHE.clear()
 
     def connect_wms(self) -> WebMapService:
         """Connect to the WMS service and return the connected WebMapService.
 
+        The parsed capabilities are shared by all clients in the process that
+        point at the same URL and WMS version, so only the first connection
+        downloads and parses the GetCapabilities document. Clients connecting
+        concurrently wait for that download rather than repeating it.
+
         Returns:
             The connected WebMapService instance.
         """
-        wms_url = self.base_url if self.base_url.endswith("/wms") else f"{self.base_url}/wms"
-        try:
-            self._wms = WebMapService(wms_url, version=self.wms_version)
-            logger.info("Connected to WMS service %s (%d layers available)", wms_url, len(self._wms.contents))
-        except Exception:
-            logger.exception("Failed to connect to WMS service at %s", wms_url)
-        else:
-            return self._wms
-            raise
+        wms_url = self.wms_url
+        key = (wms_url, self.wms_version)
+
+        with _WMS_CACHE_LOCK:
+            connect_lock = _WMS_CONNECT_LOCKS.setdefault(key, threading.Lock())
+
+        with connect_lock:
+            with _WMS_CACHE_LOCK:
+                cached = _WMS_CACHE.get(key)
+            if cached is not None:
+                wms, created_at = cached
+                if self.capabilities_ttl is None or time.monotonic() - created_at < self.capabilities_ttl:
+                    self.wms = wms
+                    return self._wms
+
+            try:
+                self.wms = WebMapService(wms_url, version=self.wms_version)
+                logger.info("Connected to WMS service %s (%d layers available)", wms_url, len(self.wms.contents))
+                with _WMS_CACHE_LOCK:
+                    _WMS_CACHE[key] = (self._wms, time.monotonic())
+            except Exception:
+                logger.exception("Failed to connect to WMS service at %s", wms_url)
+            else:
+                return self._wms
 
     def list_wms_layers(self, filter_func: Optional[Callable[[str, str], bool]] = None) -> dict[str, str]:
         """List available WMS layers from the service, optionally filtered.
@@ -78,6 +157,13 @@ class WMSClient(ABC):
         }
         return layers
 
+    @property
+    def _layer_name_set(self) -> frozenset[str]:
+        """Names of all layers offered by the WMS service, computed once per connection."""
+        if self._layer_names is None:
+            self._layer_names = frozenset(self.wms.contents)
+        return self._layer_names
+
     def check_layer_exists(self, layer_name: str) -> bool:
         """Check if a layer exists in the WMS service.
 
@@ -87,7 +173,88 @@ class WMSClient(ABC):
         Returns:
             True if layer exists, False otherwise
         """
-        return layer_name in self.wms.contents
+        return layer_name in self._layer_name_set
+
+    def check_layers_exist(self, layer_names: Iterable[str]) -> bool:
+        """Check if all given layers exist in the WMS service.
+
+        Arguments:
+            layer_names: Names of the layers to check
+
+        Returns:
+            True if every layer exists, False otherwise
+        """
+        return self._layer_name_set.issuperset(layer_names)
+
+    def _getfeatureinfo_template(self, layers: Sequence[str], info_format: str, size: int) -> str:
+        """Build a GetFeatureInfo URL for a fixed set of layers, leaving CRS and BBOX to fill in.
+
+        Clients always query the centre pixel of a square image of the same size,
+        so everything except the CRS and bounding box can be encoded once, when
+        the client is created, instead of on every request.
+
+        Arguments:
+            layers: Names of the layers to query
+            info_format: MIME type of the response
+            size: Width and height of the (virtual) map image in pixels
+
+        Returns:
+            URL template with `{crs}` and `{bbox}` placeholders
+        """
+        is_130 = self.wms_version.startswith("1.3")
+        params = {
+            "SERVICE": "WMS",
+            "VERSION": self.wms_version,
+            "REQUEST": "GetFeatureInfo",
+            "LAYERS": ",".join(layers),
+            "QUERY_LAYERS": ",".join(layers),
+            "STYLES": "",
+            "FORMAT": "image/png",
+            "INFO_FORMAT": info_format,
+            "FEATURE_COUNT": "20",
+            "WIDTH": str(size),
+            "HEIGHT": str(size),
+            "I" if is_130 else "X": str(size // 2),
+            "J" if is_130 else "Y": str(size // 2),
+        }
+        crs_param = "CRS" if is_130 else "SRS"
+        return f"{self.wms_url}?{urlencode(params)}&{crs_param}={{crs}}&BBOX={{bbox}}"
+
+    def _getfeatureinfo(self, template: str, crs: str, bbox: tuple[float, float, float, float]) -> bytes:
+        """Issue a GetFeatureInfo request built from a template.
+
+        Responses are served from and stored in the on-disk response cache
+        (see `dovwms._cache`). Only responses in the requested INFO_FORMAT are
+        cached, so service exceptions, which GeoServer returns as XML, and
+        HTML error or maintenance pages are fetched again on the next call.
+
+        Arguments:
+            template: URL template from `_getfeatureinfo_template`
+            crs: Coordinate reference system of the bounding box
+            bbox: Bounding box as (minx, miny, maxx, maxy)
+
+        Returns:
+            Raw response body
+        """
+        if self.wms_version.startswith("1.3") and _has_yx_axis_order(crs):
+            bbox = (bbox[1], bbox[0], bbox[3], bbox[2])
+        url = template.format(crs=quote(crs), bbox=",".join(map(str, bbox)))
+
+        content = _cache.load(url)
+        if content is not None:
+            return content
+
+        response = _SESSION.get(url, timeout=self.request_timeout)
+        response.raise_for_status()
+        logger.debug(
+            "GetFeatureInfo returned %s bytes on the wire (encoding: %s)",
+            response.headers.get("Content-Length", "?"),
+            response.headers.get("Content-Encoding", "identity"),
+        )
+        content_type = response.headers.get("Content-Type", "").partition(";")[0].strip().lower()
+        if content_type and content_type == _requested_info_format(template):
+            _cache.store(url, response.content)
+        return response.content
 
     @abstractmethod
     def parse_feature_info(self, content: str, **kwargs: Any) -> dict[str, Any]:
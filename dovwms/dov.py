@@ -1,16 +1,56 @@
 """Client for the Belgian DOV (Databank Ondergrond Vlaanderen) API."""
 
-import json
+import copy
 import logging
-from typing import Any, Callable, Optional
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Final, Optional, Union
 
 from shapely.geometry import Point
 
 from dovwms.base import WMSClient
-from dovwms.geopunt import get_elevation
+from dovwms.geopunt import _geopunt_client, get_elevation
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is an optional speed-up, see the "fast" extra
+    import json as _json  # type: ignore[no-redef]
 
 logger = logging.getLogger(__name__)
 
+# Shared pool that runs elevation lookups alongside the texture request, so
+# fetch_profile does not build and tear down a thread pool on every call
+_ELEVATION_EXECUTOR: Final = ThreadPoolExecutor(max_workers=8, thread_name_prefix="dovwms-elevation")
+
+# Texture layers from DOV bodemanalysie service.
+_TEXTURE_LAYERS: Final = (
+    "bdbstat:fractie_klei_basisdata_bodemkartering",  # clay
+    "bdbstat:fractie_leem_basisdata_bodemkartering",  # silt
+    "bdbstat:fractie_zand_basisdata_bodemkartering",  # sand
+)
+_TEXTURE_LAYER_SET: Final = frozenset(_TEXTURE_LAYERS)
+
+# Map Dutch depth notation used as property keys by the texture layers to layer info
+_DEPTH_MAPPING: Final[dict[str, tuple[int, int, str]]] = {
+    "_0_-_10_cm": (0, 10, "Layer_0-10cm"),
+    "_10_-_30_cm": (10, 30, "Layer_10-30cm"),
+    "_30_-_60_cm": (30, 60, "Layer_30-60cm"),
+    "_60_-_100_cm": (60, 100, "Layer_60-100cm"),
+    "_100_-_150_cm": (100, 150, "Layer_100-150cm"),
+}
+_DEPTH_KEYS: Final = tuple(_DEPTH_MAPPING)
+_UNCERTAINTY_KEYS: Final = tuple(f"{key}_betrouwbaarheid" for key in _DEPTH_KEYS)
+# Pull all depth values (or uncertainties) out of a feature's properties in one call
+_get_depth_values: Final = itemgetter(*_DEPTH_KEYS)
+_get_depth_uncertainties: Final = itemgetter(*_UNCERTAINTY_KEYS)
+
+# Metadata sources for the texture fractions, one per queried DOV layer
+_CLAY_SOURCE: Final = "DOV WMS, bdbstat:fractie_klei_basisdata_bodemkartering"
+_SILT_SOURCE: Final = "DOV WMS, bdbstat:fractie_leem_basisdata_bodemkartering"
+_SAND_SOURCE: Final = "DOV WMS, bdbstat:fractie_zand_basisdata_bodemkartering"
+
 
 class DOVClient(WMSClient):
     """Client for fetching soil data from the Belgian DOV API."""
@@ -22,6 +62,13 @@ class DOVClient(WMSClient):
         and related geological information. Open for further expasion.
         """
         super().__init__(base_url="https://www.dov.vlaanderen.be/geoserver")
+        self._texture_template = self._getfeatureinfo_template(_TEXTURE_LAYERS, "application/json", 100)
+        self._soil_layers: Optional[dict[str, str]] = None
+
+    def _reset_layer_caches(self) -> None:
+        """Forget the memoized layer names and soil layer listing."""
+        super()._reset_layer_caches()
+        self._soil_layers = None
 
     def list_wms_layers(self, filter_func: Optional[Callable[[str, str], bool]] = None) -> dict[str, str]:
         """List available WMS layers from the DOV service.
@@ -34,15 +81,17 @@ class DOVClient(WMSClient):
         Returns:
             Dictionary of layer names and titles
         """
+        if filter_func is not None:
+            return super().list_wms_layers(filter_func=filter_func)
 
-        def soil_filter(name: str, title: str) -> bool:
-            if filter_func is not None:
-                return filter_func(name, title)
-            return "bodem" in name.lower()
-
-        return super().list_wms_layers(filter_func=soil_filter)
+        # The soil layers only change with the capabilities, so compute them once per connection
+        if self._soil_layers is None:
+            self._soil_layers = {
+                name: layer.title for name, layer in self.wms.contents.items() if "bodem" in name.lower()
+            }
+        return dict(self._soil_layers)
 
-    def parse_feature_info(self, content: str, **kwargs: Any) -> dict[str, Any]:
+    def parse_feature_info(self, content: Union[str, bytes], **kwargs: Any) -> dict[str, Any]:
         """Parse GetFeatureInfo response from DOV WMS.
 
         The parsing method depends on the content type and query type:
@@ -50,7 +99,7 @@ class DOVClient(WMSClient):
         - For other queries: Returns raw content for specific handling
 
         Arguments:
-            content: Raw response content
+            content: Raw response content, as text or undecoded bytes
             **kwargs: Additional parameters:
                 - content_type: Expected content type
                 - query_type: Type of query (e.g., 'texture', 'properties')
@@ -66,7 +115,7 @@ class DOVClient(WMSClient):
 
         return {"content": content}
 
-    def _parse_texture_response(self, data: Any) -> dict[str, Any]:
+    def _parse_texture_response(self, data: Union[str, bytes]) -> dict[str, Any]:
         """Parse the WMS GetFeatureInfo response to extract texture fractions.
 
         Always returns a dictionary with a single key "layers" containing a
@@ -75,56 +124,33 @@ class DOVClient(WMSClient):
         returned dict without special-casing list vs dict.
 
         Args:
-            data: data from a WMS GetFeatureInfo response (JSON string)
+            data: data from a WMS GetFeatureInfo response (JSON string or bytes)
 
         Returns:
             Dict with key "layers" mapping to a list of layer dicts. If no
             features were found, returns {"layers": []}.
         """
-        json_data = json.loads(data)
-        features = json_data.get("features", [])
+        json_data: dict[str, Any] = _json.loads(data)
+        features: list[dict[str, Any]] = json_data.get("features", [])
 
         if not features:
             return {"layers": []}
 
-        properties = [feature.get("properties") for feature in features]
-
-        # create Layer objects for each of the profiles
-        depth_keys = [k for k in properties[0] if not k.endswith("_betrouwbaarheid")]
+        # Only the properties of the clay, silt and sand features are used; ids, geometry
+        # and the collection metadata are never touched.
+        properties: list[dict[str, float]] = [feature["properties"] for feature in features[:3]]
 
-        # Map Dutch depth notation to layer info
-        depth_mapping = {
-            "_0_-_10_cm": (0, 10, "Layer_0-10cm"),
-            "_10_-_30_cm": (10, 30, "Layer_10-30cm"),
-            "_30_-_60_cm": (30, 60, "Layer_30-60cm"),
-            "_60_-_100_cm": (60, 100, "Layer_60-100cm"),
-            "_100_-_150_cm": (100, 150, "Layer_100-150cm"),
-        }
+        # Gather values and uncertainties column-wise: one row per fraction (clay, silt, sand),
+        # one column per depth, so each layer below is a single zip step.
+        values = [_get_depth_values(props) for props in properties]
+        uncertainties = [_get_depth_uncertainties(props) for props in properties]
 
-        layers = []
-
-        for depth_key in depth_keys:
-            ci_key = f"{depth_key}_betrouwbaarheid"
-
-            # Extract texture percentages and confidence intervals
-            clay_pct = properties[0][depth_key]
-            clay_mtd = {
-                "source": "DOV WMS, bdbstat:fractie_klei_basisdata_bodemkartering",
-                "uncertainty": properties[0][ci_key],
-            }
-            silt_pct = properties[1][depth_key]
-            silt_mtd = {
-                "source": "DOV WMS, bdbstat:fractie_leem_basisdata_bodemkartering",
-                "uncertainty": properties[1][ci_key],
-            }
-            sand_pct = properties[2][depth_key]
-            sand_mtd = {
-                "source": "DOV WMS, bdbstat:fractie_zand_basisdata_bodemkartering",
-                "uncertainty": properties[2][ci_key],
-            }
+        layers: list[dict[str, Any]] = []
 
-            # Get depth info
-            top_depth, bottom_depth, layer_name = depth_mapping[depth_key]
+        for depth_info, fractions, fraction_cis in zip(_DEPTH_MAPPING.values(), zip(*values), zip(*uncertainties)):
+            top_depth, bottom_depth, layer_name = depth_info
+            clay_pct, silt_pct, sand_pct = fractions
+            clay_ci, silt_ci, sand_ci = fraction_cis
 
             # Create SoilLayer object
             layer = {
@@ -135,9 +161,9 @@ class DOVClient(WMSClient):
                 "silt_content": silt_pct,
                 "clay_content": clay_pct,
                 "metadata": {
-                    "sand_content": sand_mtd,
-                    "silt_content": silt_mtd,
-                    "clay_content": clay_mtd,
+                    "sand_content": {"source": _SAND_SOURCE, "uncertainty": sand_ci},
+                    "silt_content": {"source": _SILT_SOURCE, "uncertainty": silt_ci},
+                    "clay_content": {"source": _CLAY_SOURCE, "uncertainty": clay_ci},
                 },
             }
 
@@ -152,7 +178,8 @@ class DOVClient(WMSClient):
 
         This method queries the DOV WMS service for clay, silt, and sand content
         at different depths at the specified location. The data is used to create
-        a SoilProfile object with appropriate layers.
+        a SoilProfile object with appropriate layers. When elevation is requested,
+        the Geopunt query runs in a background thread alongside the DOV query.
 
         Args:
             location: Point object with x, y coordinates
@@ -162,46 +189,125 @@ class DOVClient(WMSClient):
         Returns:
             Dictionary with texture data ("layers" key and optional "elevation") or None if data not found
         """
-        # Texture layers from DOV bodemanalysie service.
-        wms_layers = [
-            "bdbstat:fractie_klei_basisdata_bodemkartering",  # clay
-            "bdbstat:fractie_leem_basisdata_bodemkartering",  # silt
-            "bdbstat:fractie_zand_basisdata_bodemkartering",  # sand
-        ]
-
-        # Verify layers exist
-        for layer_name in wms_layers:
-            if not self.check_layer_exists(layer_name):
-                logger.warning("Layer %s not found", layer_name)
-                return None
-
         # Define query area
         buffer = 0.0001
         bbox = (location.x - buffer, location.y - buffer, location.x + buffer, location.y + buffer)
 
         try:
+            # Verify layers exist; this connects to the service on first use
+            if not self.check_layers_exist(_TEXTURE_LAYERS):
+                missing = _TEXTURE_LAYER_SET - self._layer_name_set
+                logger.warning("Layers not found: %s", ", ".join(sorted(missing)))
+                return None
+
+            # Start the elevation request first so both services are queried concurrently
+            elevation_future = None
+            if fetch_elevation:
+                elevation_future = _ELEVATION_EXECUTOR.submit(get_elevation, location, crs)
+
             # Query texture data
-            response = self.wms.getfeatureinfo(
-                layers=wms_layers,
-                query_layers=wms_layers,
-                srs=crs,
-                bbox=bbox,
-                size=(100, 100),
-                info_format="application/json",
-                xy=(50, 50),  # center pixel
-            )
+            content = self._getfeatureinfo(self._texture_template, crs, bbox)
 
-            result = self.parse_feature_info(response.read(), content_type="application/json", query_type="texture")
+            result = self.parse_feature_info(content, content_type="application/json", query_type="texture")
 
-            if fetch_elevation:
-                elevation = get_elevation(location, crs)
-                result["elevation"] = elevation
+            if elevation_future is not None:
+                result["elevation"] = elevation_future.result()
         except Exception:
             logger.exception("Failed to fetch profile")
             return None
         else:
             return result
 
+    def fetch_profiles(
+        self,
+        locations: Sequence[Point],
+        fetch_elevation: bool = False,
+        crs: str = "EPSG:31370",
+        max_workers: int = 8,
+    ) -> list[Optional[dict[str, Any]]]:
+        """Fetch soil texture information at several locations concurrently.
+
+        Each location is fetched with `fetch_profile` in a thread pool, so a
+        batch takes roughly as long as its slowest request instead of the sum
+        of all of them. `max_workers` caps the number of requests in flight to
+        avoid overloading the DOV server. Both services are connected to once,
+        before the workers start: if DOV cannot be reached every entry is None,
+        and if Geopunt cannot be reached the profiles have no elevation.
+
+        Args:
+            locations: Point objects with x, y coordinates
+            fetch_elevation: Whether to fetch the elevation of each location from Geopunt.
+            crs: Coordinate reference system
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            List with one result per location, in the same order. Entries are None
+            where the profile could not be fetched.
+        """
+        # Connect to both services once up front, so the workers neither race to
+        # connect nor each retry a service that is unreachable
+        if self._wms is None and self.connect_wms() is None:
+            return [None] * len(locations)
+
+        elevation_unavailable = False
+        if fetch_elevation:
+            geopunt = _geopunt_client()
+            if geopunt._wms is None and geopunt.connect_wms() is None:
+                logger.warning("Elevation service unavailable, fetching profiles without elevation")
+                fetch_elevation = False
+                elevation_unavailable = True
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="dovwms") as executor:
+            profiles = list(
+                executor.map(lambda location: self.fetch_profile(location, fetch_elevation, crs), locations)
+            )
+
+        if elevation_unavailable:
+            for profile in profiles:
+                if profile is not None:
+                    profile["elevation"] = None
+        return profiles
+
+
+@lru_cache(maxsize=1)
+def _dov_client() -> DOVClient:
+    """Return the process-wide DOVClient used by the convenience functions."""
+    return DOVClient()
+
+
+class _UncacheableProfile(LookupError):
+    """Carries a profile that was fetched only partially and must not be cached."""
+
+    def __init__(self, profile: dict[str, Any]) -> None:
+        super().__init__()
+        self.profile = profile
+
+
+@lru_cache(maxsize=4096)
+def _cached_profile(x: float, y: float, crs: str, fetch_elevation: bool) -> dict[str, Any]:
+    """Fetch a profile with the shared DOVClient, memoized on the query arguments.
+
+    Raises:
+        LookupError: If the profile could not be fetched. Raising instead of
+            returning None keeps transient failures out of the cache.
+        _UncacheableProfile: If the elevation was requested but could not be
+            fetched. The texture data is returned through the exception so the
+            next call retries the elevation.
+    """
+    # Create location point
+    location = Point(x, y)
+
+    # Reuse the DOV client, and with it its connection and layer lookups
+    client = _dov_client()
+
+    # Fetch profile. Use the public DOVClient API: (location, fetch_elevation, crs)
+    profile = client.fetch_profile(location, fetch_elevation=fetch_elevation, crs=crs)
+    if profile is None:
+        raise LookupError
+    if fetch_elevation and profile.get("elevation") is None:
+        raise _UncacheableProfile(profile)
+    return profile
+
 
 def get_profile_from_dov(
     x: float, y: float, crs: str = "EPSG:31370", fetch_elevation: bool = True, profile_name: Optional[str] = None
@@ -212,6 +318,10 @@ def get_profile_from_dov(
     to get a soil profile from the DOV service. It's a simpler alternative to
     creating and managing DOV and Geopunt clients manually.
 
+    Successful results are cached per (x, y, crs, fetch_elevation) for the
+    lifetime of the process, so repeated queries at the same point do not
+    hit the network again. Each call returns its own copy of the profile.
+
     Args:
         x: X-coordinate in the specified CRS (default Lambert72)
         y: Y-coordinate in the specified CRS (default Lambert72)
@@ -229,23 +339,18 @@ def get_profile_from_dov(
         >>> print(f"Number of layers: {len(profile.layers)}")
     """
     try:
-        # Create location point
-        location = Point(x, y)
-
         # Use coordinates for profile name if none provided (kept for backward compatibility,
         # but DOVClient.fetch_profile does not currently accept a profile_name parameter)
         if profile_name is None:
             profile_name = f"Profile_{x:.0f}_{y:.0f}"
 
-        # Create DOV client
-        client = DOVClient()
-
-        # Fetch profile. Use the public DOVClient API: (location, fetch_elevation, crs)
-        profile = client.fetch_profile(location, fetch_elevation=fetch_elevation, crs=crs)
+        profile = copy.deepcopy(_cached_profile(x, y, crs, fetch_elevation))
+    except _UncacheableProfile as partial:
+        return partial.profile
+    except LookupError:
+        return None
     except Exception:
         logger.exception("Failed to get profile from DOV")
         return None
     else:
         return profile
-        logger.exception("Error fetching profile from DOV")
-        return None
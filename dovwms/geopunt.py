@@ -1,7 +1,9 @@
 # mypy: disable-error-code="import-untyped"
 
+import copy
 import logging
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Final, Optional, Union
 
 from shapely.geometry import Point
 
@@ -9,14 +11,21 @@ from dovwms.base import WMSClient
 
 logger = logging.getLogger(__name__)
 
+# Layer name for Digital Terrain Model (1m resolution)
+_DTM_LAYER: Final = "DHMVII_DTM_1m"
+
+# Size of the (virtual) map image; the elevation is read at its centre pixel
+_IMAGE_SIZE: Final = 256
+
 
 class GeopuntClient(WMSClient):
     """Client for fetching data from the Geopunt API."""
 
     def __init__(self) -> None:
         super().__init__(base_url="https://geo.api.vlaanderen.be/DHMV")
+        self._dtm_template = self._getfeatureinfo_template([_DTM_LAYER], "text/plain", _IMAGE_SIZE)
 
-    def parse_feature_info(self, content: str, **kwargs: Any) -> dict[str, Any]:
+    def parse_feature_info(self, content: Union[str, bytes], **kwargs: Any) -> dict[str, Any]:
         """Parse GetFeatureInfo response from Geopunt WMS.
 
         The parsing method depends on the content type and query type:
@@ -25,7 +34,7 @@ class GeopuntClient(WMSClient):
         - One substantial change.
 
         Args:
-            content: Raw response content
+            content: Raw response content, as text or undecoded bytes
             **kwargs: Additional parameters:
                 - content_type: Expected content type
                 - query_type: Type of query (e.g., 'elevation')
@@ -41,9 +50,13 @@ class GeopuntClient(WMSClient):
 
         return {"content": content}
 
-    def _parse_elevation_response(self, content: str) -> Optional[float]:
+    def _parse_elevation_response(self, content: Union[str, bytes]) -> Optional[float]:
         """Parse elevation data from GetFeatureInfo response.
 
+        The value is the third semicolon-separated field. Only the first three
+        splits are made, and `float` accepts bytes and surrounding whitespace,
+        so the response needs neither decoding nor stripping.
+
         Args:
             content: Raw response content from WMS GetFeatureInfo
 
@@ -55,12 +68,13 @@ class GeopuntClient(WMSClient):
             "@DHMVII_DTM_1m Stretched value;Pixel Value; 32.360001;32.360001;"
         """
         try:
-            values = content.strip().split(";")
-            if len(values) >= 3:
-                return float(values[2].strip())
-        except (ValueError, IndexError) as e:
+            fields = content.split(";", 3) if isinstance(content, str) else content.split(b";", 3)
+            return float(fields[2])
+        except IndexError:
+            return None
+        except ValueError as e:
             logger.warning("Error parsing elevation data: %s", e)
-        return None
+            return None
 
     def fetch_elevation(
         self, location: Point, crs: str = "EPSG:31370", layer_name: str = "DHMVII_DTM_1m"
@@ -73,8 +87,6 @@ class GeopuntClient(WMSClient):
         Returns:
             Elevation in meters or None if not found
         """
-        # Layer name for Digital Terrain Model (1m resolution)
-
         if not self.check_layer_exists(layer_name):
             try:
                 available = list(self.wms.contents.keys())
@@ -86,24 +98,16 @@ class GeopuntClient(WMSClient):
         buffer = 0.0001
         bbox = (location.x - buffer, location.y - buffer, location.x + buffer, location.y + buffer)
 
-        # Image size and center pixel
-        img_width = img_height = 256
-        pixel_x = pixel_y = img_width // 2
+        if layer_name == _DTM_LAYER:
+            template = self._dtm_template
+        else:
+            template = self._getfeatureinfo_template([layer_name], "text/plain", _IMAGE_SIZE)
 
         try:
             # Make GetFeatureInfo request
-            response = self.wms.getfeatureinfo(
-                layers=[layer_name],
-                query_layers=[layer_name],
-                info_format="text/plain",
-                srs=crs,
-                bbox=bbox,
-                size=(img_width, img_height),
-                xy=(pixel_x, pixel_y),
-            )
+            content = self._getfeatureinfo(template, crs, bbox)
 
             # Parse response using the base class method
-            content = response.read().decode("utf-8")
             elevation = self.parse_feature_info(content, content_type="text/plain", query_type="elevation")
 
             if elevation is not None:
@@ -115,14 +119,40 @@ class GeopuntClient(WMSClient):
             return elevation
 
 
+@lru_cache(maxsize=1)
+def _geopunt_client() -> GeopuntClient:
+    """Return the process-wide GeopuntClient used by the convenience functions."""
+    return GeopuntClient()
+
+
+@lru_cache(maxsize=4096)
+def _cached_elevation(x: float, y: float, crs: str, layer_name: str) -> dict[str, Any]:
+    """Fetch elevation with the shared GeopuntClient, memoized on the query arguments.
+
+    Raises:
+        LookupError: If the elevation could not be fetched. Raising instead of
+            returning None keeps transient failures out of the cache.
+    """
+    client = _geopunt_client()
+    elevation = client.fetch_elevation(Point(x, y), crs, layer_name)
+    if elevation is None:
+        raise LookupError
+    return elevation
+
+
 def get_elevation(
     location: Point, crs: str = "EPSG:31370", layer_name: str = "DHMVII_DTM_1m"
 ) -> Optional[dict[str, Any]]:
     """Convenience wrapper to fetch elevation using the GeopuntClient.
 
-    This helper creates a GeopuntClient, requests the elevation for the
+    This helper uses a shared GeopuntClient, requests the elevation for the
     provided location and returns the value. Tests can patch this function
     to avoid instantiating the client or making network calls.
+
+    Successful results are cached per (x, y, crs, layer_name) for the
+    lifetime of the process; each call returns its own copy.
     """
-    client = GeopuntClient()
-    return client.fetch_elevation(location, crs, layer_name)
+    try:
+        return copy.deepcopy(_cached_elevation(location.x, location.y, crs, layer_name))
+    except LookupError:
+        return None
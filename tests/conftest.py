@@ -3,10 +3,67 @@
 Place common fixtures here so test modules can import them implicitly.
 """
 
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock
+
 import pytest
 from shapely.geometry import Point
 
 from dovwms import DOVClient, GeopuntClient
+from dovwms.base import WMSClient
+from dovwms.dov import _TEXTURE_LAYER_SET, _cached_profile, _dov_client
+from dovwms.geopunt import _cached_elevation, _geopunt_client
+
+try:
+    from orjson import dumps as _orjson_dumps
+except ImportError:  # orjson is only installed with the "fast" extra
+    _orjson_dumps = None
+
+
+def _dumps(obj):
+    """Serialize a mock payload to JSON bytes, as GetFeatureInfo responses arrive."""
+    if _orjson_dumps is not None:
+        return _orjson_dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-integration", action="store_true", default=False, help="run tests that query the live services"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked `integration` unless --run-integration is given."""
+    if config.getoption("--run-integration"):
+        return
+    skip_integration = pytest.mark.skip(reason="needs --run-integration")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
+def _clear_caches():
+    WMSClient.invalidate_cache()
+    _cached_profile.cache_clear()
+    _cached_elevation.cache_clear()
+    _dov_client.cache_clear()
+    _geopunt_client.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    """Keep the process-wide capabilities and result caches from leaking between tests."""
+    _clear_caches()
+    yield
+    _clear_caches()
+
+
+@pytest.fixture(autouse=True)
+def no_response_cache(monkeypatch):
+    """Keep tests from reading or writing the on-disk response cache."""
+    monkeypatch.setenv("DOVWMS_NO_CACHE", "1")
 
 
 @pytest.fixture
@@ -15,6 +72,54 @@ def dov_client():
     return DOVClient()
 
 
+@pytest.fixture
+def dov_mocks(monkeypatch):
+    """Stub out the collaborators of DOVClient.fetch_profile.
+
+    All texture layers are reported as available, and the GetFeatureInfo request,
+    the response parser and the elevation helper are replaced by mocks that tests
+    configure inline, e.g. `dov_mocks.parse.return_value = {...}`.
+    """
+    mocks = SimpleNamespace(getfeatureinfo=Mock(), parse=Mock(), get_elevation=Mock())
+    monkeypatch.setattr(DOVClient, "_layer_name_set", _TEXTURE_LAYER_SET)
+    monkeypatch.setattr(DOVClient, "_getfeatureinfo", mocks.getfeatureinfo)
+    monkeypatch.setattr(DOVClient, "parse_feature_info", mocks.parse)
+    monkeypatch.setattr("dovwms.dov.get_elevation", mocks.get_elevation)
+    return mocks
+
+
+@pytest.fixture
+def patched_client(monkeypatch):
+    """Replace DOVClient in `dovwms.dov` and provide the mock client it constructs."""
+    client = Mock()
+    monkeypatch.setattr("dovwms.dov.DOVClient", Mock(return_value=client))
+    return client
+
+
+@pytest.fixture
+def make_wms_mock():
+    """Build a stand-in for a connected WebMapService offering the given layers.
+
+    Call it with a mapping of layer names to titles and assign the result to
+    a client's `wms` attribute.
+    """
+
+    def _make(layers):
+        return Mock(contents={name: Mock(title=title) for name, title in layers.items()})
+
+    return _make
+
+
+@pytest.fixture
+def make_response():
+    """Build a stand-in for the HTTP response to a GetFeatureInfo request."""
+
+    def _make(content=b"", content_type="application/json"):
+        return Mock(content=content, headers={"Content-Type": content_type})
+
+    return _make
+
+
 @pytest.fixture
 def geopunt_client():
     """Provide a Geopunt client instance for testing."""
@@ -27,9 +132,12 @@ def sample_location():
     return Point(247172.56, 204590.58)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_wms_response():
-    """Provide a mock WMS GetFeatureInfo response with texture data."""
+    """Provide a mock WMS GetFeatureInfo response with texture data.
+
+    Shared by the whole session, so tests must not modify it.
+    """
     # Realistic WMS-like response with numeric uncertainty values and extra metadata
     return {
         "type": "FeatureCollection",
@@ -93,7 +201,19 @@ def mock_wms_response():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def mock_wms_json(mock_wms_response):
+    """Provide the mock texture response serialized once as JSON bytes."""
+    return _dumps(mock_wms_response)
+
+
+@pytest.fixture(scope="session")
 def empty_wms_response():
     """Provide an empty WMS response."""
     return {"type": "FeatureCollection", "features": []}
+
+
+@pytest.fixture(scope="session")
+def empty_wms_json(empty_wms_response):
+    """Provide the empty response serialized once as JSON bytes."""
+    return _dumps(empty_wms_response)
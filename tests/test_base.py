@@ -0,0 +1,122 @@
+"""Tests for the WMS base client."""
+
+import threading
+import time
+from unittest.mock import Mock, patch
+
+from dovwms import DOVClient, GeopuntClient
+
+
+@patch("dovwms.base.WebMapService")
+def test_connect_wms_reuses_cached_capabilities(mock_wms_cls):
+    """Test that clients sharing a WMS URL only fetch the capabilities once."""
+    first = DOVClient().wms
+    second = DOVClient().wms
+
+    assert first is second
+    mock_wms_cls.assert_called_once_with("https://www.dov.vlaanderen.be/geoserver/wms", version="1.3.0")
+
+
+@patch("dovwms.base.WebMapService")
+def test_connect_wms_cache_is_keyed_by_url(mock_wms_cls):
+    """Test that different services get their own cached connection."""
+    DOVClient().connect_wms()
+    GeopuntClient().connect_wms()
+
+    assert mock_wms_cls.call_count == 2
+
+
+@patch("dovwms.base.WebMapService")
+def test_invalidate_cache_forces_reconnect(mock_wms_cls):
+    """Test that invalidating the cache triggers a fresh capabilities request."""
+    DOVClient().connect_wms()
+    DOVClient.invalidate_cache()
+    DOVClient().connect_wms()
+
+    assert mock_wms_cls.call_count == 2
+
+
+@patch("dovwms.base.WebMapService")
+def test_connect_wms_cache_expires_after_ttl(mock_wms_cls, monkeypatch):
+    """Test that cached capabilities are refetched once the TTL has passed."""
+    monkeypatch.setattr(DOVClient, "capabilities_ttl", 0.0)
+
+    DOVClient().connect_wms()
+    DOVClient().connect_wms()
+
+    assert mock_wms_cls.call_count == 2
+
+
+@patch("dovwms.base.WebMapService")
+def test_connect_wms_concurrent_clients_fetch_once(mock_wms_cls):
+    """Test that clients connecting at the same time share a single capabilities download."""
+    barrier = threading.Barrier(8)
+
+    def slow_capabilities(url, version):
+        time.sleep(0.05)
+        return Mock(contents={})
+
+    def connect():
+        barrier.wait()
+        DOVClient().connect_wms()
+
+    mock_wms_cls.side_effect = slow_capabilities
+    threads = [threading.Thread(target=connect) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    mock_wms_cls.assert_called_once()
+
+
+def test_check_layers_exist(dov_client, make_wms_mock):
+    """Test single and batched layer existence checks against the capabilities."""
+    dov_client.wms = make_wms_mock({"bodem:texture": "Soil Texture", "bodem:type": "Soil Type"})
+
+    assert dov_client.check_layer_exists("bodem:texture")
+    assert not dov_client.check_layer_exists("geologie:bedrock")
+    assert dov_client.check_layers_exist(["bodem:texture", "bodem:type"])
+    assert not dov_client.check_layers_exist(["bodem:texture", "geologie:bedrock"])
+
+
+def test_wms_setter_resets_layer_names(dov_client, make_wms_mock):
+    """Test that replacing the WMS connection refreshes the known layer names."""
+    dov_client.wms = make_wms_mock({"bodem:texture": "Soil Texture"})
+    assert dov_client.check_layer_exists("bodem:texture")
+
+    dov_client.wms = make_wms_mock({"bodem:type": "Soil Type"})
+
+    assert not dov_client.check_layer_exists("bodem:texture")
+    assert dov_client.check_layer_exists("bodem:type")
+
+
+def test_getfeatureinfo_template(dov_client):
+    """Test that the template fixes everything but the CRS and bounding box."""
+    template = dov_client._getfeatureinfo_template(["bodem:texture"], "text/plain", 256)
+
+    assert template.startswith("https://www.dov.vlaanderen.be/geoserver/wms?SERVICE=WMS&VERSION=1.3.0")
+    for param in ("REQUEST=GetFeatureInfo", "QUERY_LAYERS=bodem%3Atexture", "WIDTH=256", "I=128", "J=128"):
+        assert param in template
+    assert template.endswith("&CRS={crs}&BBOX={bbox}")
+
+
+@patch("dovwms.base._SESSION.get")
+def test_getfeatureinfo_fills_template(mock_get, dov_client, make_response):
+    """Test that the request URL carries the CRS and bounding box."""
+    mock_get.return_value = make_response(b"payload")
+
+    content = dov_client._getfeatureinfo("https://example.com/wms?CRS={crs}&BBOX={bbox}", "EPSG:31370", (1, 2, 3, 4))
+
+    assert content == b"payload"
+    assert mock_get.call_args[0][0] == "https://example.com/wms?CRS=EPSG%3A31370&BBOX=1,2,3,4"
+    mock_get.return_value.raise_for_status.assert_called_once()
+
+
+@patch("dovwms.base._SESSION.get")
+def test_getfeatureinfo_swaps_axes_for_latlon_crs(mock_get, dov_client, make_response):
+    """Test that WMS 1.3.0 bounding boxes in EPSG:4326 are sent in lat/lon order."""
+    mock_get.return_value = make_response()
+    dov_client._getfeatureinfo("https://example.com/wms?BBOX={bbox}&CRS={crs}", "EPSG:4326", (3.0, 50.0, 4.0, 51.0))
+
+    assert mock_get.call_args[0][0] == "https://example.com/wms?BBOX=50.0,3.0,51.0,4.0&CRS=EPSG%3A4326"
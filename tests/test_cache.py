@@ -0,0 +1,99 @@
+"""Tests for the on-disk response cache."""
+
+import sqlite3
+from contextlib import closing
+from unittest.mock import patch
+
+import pytest
+
+from dovwms import _cache
+
+URL = "https://example.com/wms?INFO_FORMAT=application%2Fjson&CRS={crs}&BBOX={bbox}"
+
+
+@pytest.fixture
+def response_cache(tmp_path, monkeypatch):
+    """Enable the response cache in a temporary directory."""
+    monkeypatch.delenv("DOVWMS_NO_CACHE")
+    monkeypatch.setenv("DOVWMS_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_store_and_load(response_cache):
+    """Test that a stored response is returned for the same URL only."""
+    _cache.store("https://example.com/a", b"payload")
+
+    assert _cache.load("https://example.com/a") == b"payload"
+    assert _cache.load("https://example.com/b") is None
+    assert (response_cache / "responses.sqlite").exists()
+
+
+def test_expired_entries_are_ignored(response_cache, monkeypatch):
+    """Test that responses older than the expiry are not served."""
+    _cache.store("https://example.com/a", b"payload")
+    monkeypatch.setattr(_cache, "EXPIRE_AFTER", -1)
+
+    assert _cache.load("https://example.com/a") is None
+
+
+def test_expired_entries_are_deleted_on_open(response_cache, monkeypatch):
+    """Test that a new process removes expired responses from the database."""
+    _cache.store("https://example.com/a", b"payload")
+    monkeypatch.setattr(_cache, "EXPIRE_AFTER", -1)
+    monkeypatch.setattr(_cache, "_initialized", set())
+
+    _cache.load("https://example.com/a")
+
+    with closing(sqlite3.connect(response_cache / "responses.sqlite")) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM responses").fetchone() == (0,)
+
+
+def test_clear(response_cache):
+    """Test that clearing removes all responses."""
+    _cache.store("https://example.com/a", b"payload")
+    _cache.clear()
+
+    assert _cache.load("https://example.com/a") is None
+
+
+def test_disabled_by_environment(response_cache, monkeypatch):
+    """Test that DOVWMS_NO_CACHE turns the cache into a no-op."""
+    monkeypatch.setenv("DOVWMS_NO_CACHE", "1")
+    _cache.store("https://example.com/a", b"payload")
+
+    assert not (response_cache / "responses.sqlite").exists()
+    assert _cache.load("https://example.com/a") is None
+
+
+@patch("dovwms.base._SESSION.get")
+def test_getfeatureinfo_served_from_cache(mock_get, response_cache, dov_client, make_response):
+    """Test that a repeated GetFeatureInfo request does not hit the network."""
+    mock_get.return_value = make_response(b'{"features": []}')
+
+    first = dov_client._getfeatureinfo(URL, "EPSG:31370", (1, 2, 3, 4))
+    second = dov_client._getfeatureinfo(URL, "EPSG:31370", (1, 2, 3, 4))
+
+    assert first == second == b'{"features": []}'
+    mock_get.assert_called_once()
+
+
+@patch("dovwms.base._SESSION.get")
+def test_getfeatureinfo_does_not_cache_service_exceptions(mock_get, response_cache, dov_client, make_response):
+    """Test that XML service exceptions are fetched again on the next call."""
+    mock_get.return_value = make_response(b"<ServiceExceptionReport/>", "application/vnd.ogc.se_xml")
+
+    dov_client._getfeatureinfo(URL, "EPSG:31370", (1, 2, 3, 4))
+    dov_client._getfeatureinfo(URL, "EPSG:31370", (1, 2, 3, 4))
+
+    assert mock_get.call_count == 2
+
+
+@patch("dovwms.base._SESSION.get")
+def test_getfeatureinfo_does_not_cache_other_formats(mock_get, response_cache, dov_client, make_response):
+    """Test that a response in another format than requested, e.g. an HTML error page, is not cached."""
+    mock_get.return_value = make_response(b"<html>Service unavailable</html>", "text/html; charset=utf-8")
+
+    dov_client._getfeatureinfo(URL, "EPSG:31370", (1, 2, 3, 4))
+    dov_client._getfeatureinfo(URL, "EPSG:31370", (1, 2, 3, 4))
+
+    assert mock_get.call_count == 2
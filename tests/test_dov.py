@@ -1,12 +1,13 @@
 """Tests for the DOV client module."""
 
-import json
 from unittest.mock import Mock, patch
 
 import pytest
 from shapely.geometry import Point
 
+import dovwms.dov
 from dovwms import DOVClient, get_profile_from_dov
+from dovwms.dov import _TEXTURE_LAYER_SET as TEXTURE_LAYERS
 
 # Shared fixtures were moved to tests/conftest.py
 
@@ -45,14 +46,45 @@ def test_list_wms_layers_all(mock_list, dov_client):
     mock_list.assert_called_once()
 
 
+def test_list_wms_layers_caches_soil_layers(dov_client, make_wms_mock):
+    """Test that the default soil listing is computed once and returned as a copy."""
+    wms = make_wms_mock({"bodem:texture": "Soil Texture", "geologie:bedrock": "Bedrock"})
+    wms.contents = Mock(wraps=wms.contents)
+    dov_client.wms = wms
+
+    first = dov_client.list_wms_layers()
+    first.clear()
+    second = dov_client.list_wms_layers()
+
+    assert second == {"bodem:texture": "Soil Texture"}
+    wms.contents.items.assert_called_once()
+
+
+def test_list_wms_layers_custom_filter(dov_client, make_wms_mock):
+    """Test that a custom filter is applied to all layers."""
+    dov_client.wms = make_wms_mock({"bodem:texture": "Soil Texture", "geologie:bedrock": "Bedrock"})
+
+    layers = dov_client.list_wms_layers(filter_func=lambda name, title: name.startswith("geologie"))
+
+    assert layers == {"geologie:bedrock": "Bedrock"}
+
+
+def test_list_wms_layers_refreshes_on_new_connection(dov_client, make_wms_mock):
+    """Test that replacing the WMS connection invalidates the cached soil listing."""
+    dov_client.wms = make_wms_mock({"bodem:texture": "Soil Texture"})
+    dov_client.list_wms_layers()
+
+    dov_client.wms = make_wms_mock({"bodem:type": "Soil Type"})
+
+    assert dov_client.list_wms_layers() == {"bodem:type": "Soil Type"}
+
+
 # Tests for parse_feature_info
 
 
-def test_parse_feature_info_texture(dov_client, mock_wms_response):
+def test_parse_feature_info_texture(dov_client, mock_wms_json):
     """Test parsing texture data from WMS response."""
-    json_content = json.dumps(mock_wms_response)
-
-    result = dov_client.parse_feature_info(json_content, content_type="application/json", query_type="texture")
+    result = dov_client.parse_feature_info(mock_wms_json, content_type="application/json", query_type="texture")
 
     assert isinstance(result, dict)
     layers = result.get("layers", [])
@@ -76,11 +108,19 @@ def test_parse_feature_info_texture(dov_client, mock_wms_response):
     assert "DOV WMS" in first_layer["metadata"]["sand_content"]["source"]
 
 
-def test_parse_feature_info_empty(dov_client, empty_wms_response):
-    """Test parsing empty WMS response."""
-    json_content = json.dumps(empty_wms_response)
+def test_parse_feature_info_texture_from_text(dov_client, mock_wms_json):
+    """Test that decoded text responses parse the same as raw bytes."""
+    from_text = dov_client.parse_feature_info(
+        mock_wms_json.decode(), content_type="application/json", query_type="texture"
+    )
+    from_bytes = dov_client.parse_feature_info(mock_wms_json, content_type="application/json", query_type="texture")
+
+    assert from_text == from_bytes
 
-    result = dov_client.parse_feature_info(json_content, content_type="application/json", query_type="texture")
+
+def test_parse_feature_info_empty(dov_client, empty_wms_json):
+    """Test parsing empty WMS response."""
+    result = dov_client.parse_feature_info(empty_wms_json, content_type="application/json", query_type="texture")
 
     assert isinstance(result, dict)
     assert result.get("layers") == []
@@ -100,162 +140,263 @@ def test_parse_feature_info_raw_content(dov_client):
 # Tests for _parse_texture_response
 
 
-def test_parse_texture_response_all_layers(dov_client, mock_wms_response):
-    """Test that all depth layers are parsed correctly."""
-    json_content = json.dumps(mock_wms_response)
-    result = dov_client._parse_texture_response(json_content)
-    layers = result.get("layers", [])
+@pytest.fixture(scope="module")
+def parsed_texture(mock_wms_json):
+    """Parse the mock texture response once for all tests that only read the result."""
+    return DOVClient()._parse_texture_response(mock_wms_json)
 
-    expected_depths = [
-        (0, 10, "Layer_0-10cm"),
-        (10, 30, "Layer_10-30cm"),
-        (30, 60, "Layer_30-60cm"),
-        (60, 100, "Layer_60-100cm"),
-        (100, 150, "Layer_100-150cm"),
-    ]
 
-    assert len(layers) == len(expected_depths)
+def test_parse_texture_response_layer_count(parsed_texture):
+    """Test that one layer is parsed per depth interval."""
+    assert len(parsed_texture["layers"]) == 5
 
-    for layer, (top, bottom, name) in zip(layers, expected_depths):
-        assert layer["layer_top"] == top
-        assert layer["layer_bottom"] == bottom
-        assert layer["name"] == name
 
+@pytest.mark.parametrize(
+    "index, top, bottom, name",
+    [
+        (0, 0, 10, "Layer_0-10cm"),
+        (1, 10, 30, "Layer_10-30cm"),
+        (2, 30, 60, "Layer_30-60cm"),
+        (3, 60, 100, "Layer_60-100cm"),
+        (4, 100, 150, "Layer_100-150cm"),
+    ],
+)
+def test_parse_texture_response_all_layers(parsed_texture, index, top, bottom, name):
+    """Test that each depth layer is parsed correctly."""
+    layer = parsed_texture["layers"][index]
 
-def test_parse_texture_response_metadata_sources(dov_client, mock_wms_response):
-    """Test that metadata sources are correctly assigned."""
-    json_content = json.dumps(mock_wms_response)
-    result = dov_client._parse_texture_response(json_content)
-    layers = result.get("layers", [])
+    assert layer["layer_top"] == top
+    assert layer["layer_bottom"] == bottom
+    assert layer["name"] == name
 
-    for layer in layers:
+
+def test_parse_texture_response_metadata_sources(parsed_texture):
+    """Test that metadata sources are correctly assigned."""
+    for layer in parsed_texture["layers"]:
         metadata = layer["metadata"]
         assert "fractie_klei" in metadata["clay_content"]["source"]
         assert "fractie_leem" in metadata["silt_content"]["source"]
         assert "fractie_zand" in metadata["sand_content"]["source"]
 
 
+def test_parse_texture_response_values(parsed_texture, mock_wms_response):
+    """Test that each layer takes its fractions and uncertainties from the matching feature."""
+    clay, silt, sand = (feature["properties"] for feature in mock_wms_response["features"])
+
+    layer = parsed_texture["layers"][1]
+    assert layer["clay_content"] == clay["_10_-_30_cm"]
+    assert layer["silt_content"] == silt["_10_-_30_cm"]
+    assert layer["sand_content"] == sand["_10_-_30_cm"]
+    assert layer["metadata"]["clay_content"]["uncertainty"] == clay["_10_-_30_cm_betrouwbaarheid"]
+    assert layer["metadata"]["silt_content"]["uncertainty"] == silt["_10_-_30_cm_betrouwbaarheid"]
+    assert layer["metadata"]["sand_content"]["uncertainty"] == sand["_10_-_30_cm_betrouwbaarheid"]
+
+
 # Tests for fetch_profile
 
 
-@patch.object(DOVClient, "check_layer_exists")
-@patch.object(DOVClient, "parse_feature_info")
-def test_fetch_profile_success(mock_parse, mock_check, dov_client, sample_location, mock_wms_response):
+def test_fetch_profile_success(dov_mocks, dov_client, sample_location, mock_wms_json):
     """Test successful profile fetching without elevation."""
-    mock_check.return_value = True
-    mock_parse.return_value = {"layers": [{"name": "Layer_0-10cm", "clay_content": 15.2}]}
+    dov_mocks.parse.return_value = {"layers": [{"name": "Layer_0-10cm", "clay_content": 15.2}]}
 
-    # Mock the WMS getfeatureinfo call
-    mock_response = Mock()
-    mock_response.read.return_value = json.dumps(mock_wms_response)
-    dov_client.wms = Mock()
-    dov_client.wms.getfeatureinfo.return_value = mock_response
+    # Mock the WMS GetFeatureInfo call
+    dov_mocks.getfeatureinfo.return_value = mock_wms_json
 
     profile = dov_client.fetch_profile(sample_location, fetch_elevation=False)
 
     assert profile is not None
     assert isinstance(profile, dict)
     assert len(profile.get("layers", [])) == 1
-    mock_check.assert_called()
 
 
-@patch.object(DOVClient, "check_layer_exists")
-def test_fetch_profile_layer_not_found(mock_check, dov_client, sample_location):
+def test_fetch_profile_layer_not_found(dov_mocks, dov_client, sample_location, caplog, monkeypatch):
     """Test handling of missing layers."""
-    mock_check.return_value = False
+    monkeypatch.setattr(
+        DOVClient, "_layer_name_set", TEXTURE_LAYERS - {"bdbstat:fractie_leem_basisdata_bodemkartering"}
+    )
 
     profile = dov_client.fetch_profile(sample_location)
 
     assert profile is None
+    assert "Layers not found: bdbstat:fractie_leem_basisdata_bodemkartering" in caplog.text
+    dov_mocks.getfeatureinfo.assert_not_called()
+
+
+def test_fetch_profile_checks_layers_in_one_call(dov_mocks, dov_client, sample_location):
+    """Test that all texture layers are checked with a single batched call."""
+    dov_client.check_layers_exist = Mock(return_value=True)
+    dov_mocks.parse.return_value = {"layers": []}
 
+    dov_client.fetch_profile(sample_location)
 
-@patch.object(DOVClient, "check_layer_exists")
-def test_fetch_profile_wms_error(mock_check, dov_client, sample_location):
+    dov_client.check_layers_exist.assert_called_once()
+    assert set(dov_client.check_layers_exist.call_args[0][0]) == TEXTURE_LAYERS
+
+
+def test_fetch_profile_wms_error(dov_mocks, dov_client, sample_location):
     """Test handling of WMS service errors."""
-    mock_check.return_value = True
-    dov_client.wms = Mock()
-    dov_client.wms.getfeatureinfo.side_effect = Exception("WMS connection failed")
+    dov_mocks.getfeatureinfo.side_effect = Exception("WMS connection failed")
 
     profile = dov_client.fetch_profile(sample_location)
 
     assert profile is None
 
 
-def test_fetch_profile_custom_crs(dov_client, sample_location):
+def test_fetch_profile_custom_crs(dov_mocks, dov_client, sample_location, empty_wms_json):
     """Test profile fetching with custom CRS."""
+    dov_mocks.parse.return_value = {"layers": []}
+    dov_mocks.getfeatureinfo.return_value = empty_wms_json
+
+    dov_client.fetch_profile(sample_location, crs="EPSG:4326")
+
+    # Verify CRS was passed to the GetFeatureInfo request
+    template, crs, bbox = dov_mocks.getfeatureinfo.call_args[0]
+    assert crs == "EPSG:4326"
+    assert "INFO_FORMAT=application%2Fjson" in template
+
+
+# Tests for fetch_profiles
+
+
+@patch.object(DOVClient, "fetch_profile")
+def test_fetch_profiles_preserves_order(mock_fetch, dov_client):
+    """Test that batched results line up with the requested locations."""
+    mock_fetch.side_effect = lambda location, fetch_elevation, crs: (
+        None if location.x < 0 else {"layers": [], "x": location.x}
+    )
     dov_client.wms = Mock()
-    dov_client.check_layer_exists = Mock(return_value=True)
+    locations = [Point(x, 0) for x in (3.0, -1.0, 1.0, 2.0)]
 
-    mock_response = Mock()
-    mock_response.read.return_value = json.dumps({"features": []})
-    dov_client.wms.getfeatureinfo.return_value = mock_response
-    dov_client.parse_feature_info = Mock(return_value={"layers": []})
+    profiles = dov_client.fetch_profiles(locations, crs="EPSG:4326")
 
-    dov_client.fetch_profile(sample_location, crs="EPSG:4326")
+    assert profiles == [{"layers": [], "x": 3.0}, None, {"layers": [], "x": 1.0}, {"layers": [], "x": 2.0}]
+    assert {call.args[2] for call in mock_fetch.call_args_list} == {"EPSG:4326"}
 
-    # Verify CRS was passed to getfeatureinfo
-    call_kwargs = dov_client.wms.getfeatureinfo.call_args[1]
-    assert call_kwargs["srs"] == "EPSG:4326"
 
+@patch("dovwms.base.WebMapService")
+def test_fetch_profiles_survives_failed_connection(mock_wms_cls, dov_client):
+    """Test that an unreachable service yields None per location instead of failing the batch."""
+    mock_wms_cls.side_effect = ConnectionError("capabilities unavailable")
 
-# Tests for get_profile_from_dov convenience function
+    profiles = dov_client.fetch_profiles([Point(1.0, 2.0), Point(3.0, 4.0)])
 
+    assert profiles == [None, None]
+    mock_wms_cls.assert_called_once()
 
-@patch("dovwms.dov.DOVClient")
-def test_get_profile_from_dov_success(mock_client_cls):
-    """Test successful profile retrieval via convenience function."""
-    mock_client = Mock()
-    mock_client.fetch_profile.return_value = {"layers": [{"name": "Layer_0-10cm"}]}
-    mock_client_cls.return_value = mock_client
 
-    profile = get_profile_from_dov(247172.56, 204590.58)
+@patch("dovwms.base.WebMapService")
+def test_fetch_profiles_connects_each_service_once(mock_wms_cls, dov_mocks, dov_client):
+    """Test that a batch with elevation fetches the capabilities of each service once, up front."""
+    mock_wms_cls.return_value.contents = {}
+    dov_mocks.parse.side_effect = lambda *args, **kwargs: {"layers": []}
+    dov_mocks.get_elevation.return_value = {"elevation": 45.7}
 
-    assert profile is not None
-    mock_client.fetch_profile.assert_called_once()
+    profiles = dov_client.fetch_profiles([Point(x, 0.0) for x in range(8)], fetch_elevation=True)
+
+    assert all(profile["elevation"] == {"elevation": 45.7} for profile in profiles)
+    assert sorted(call.args[0] for call in mock_wms_cls.call_args_list) == [
+        "https://geo.api.vlaanderen.be/DHMV/wms",
+        "https://www.dov.vlaanderen.be/geoserver/wms",
+    ]
 
 
-@patch("dovwms.dov.DOVClient")
-def test_get_profile_from_dov_custom_crs(mock_client_cls):
-    """Test convenience function with custom CRS."""
-    mock_client = Mock()
-    mock_client.fetch_profile.return_value = {"layers": [{"name": "Layer_0-10cm"}]}
-    mock_client_cls.return_value = mock_client
+@patch("dovwms.base.WebMapService")
+def test_fetch_profiles_without_elevation_service(mock_wms_cls, dov_mocks, dov_client):
+    """Test that an unreachable elevation service is tried once and leaves the elevation empty."""
 
-    profile = get_profile_from_dov(6.5, 50.5, crs="EPSG:4326", fetch_elevation=False)
+    def capabilities(url, version):
+        if "geo.api.vlaanderen.be" in url:
+            raise ConnectionError
+        return Mock(contents={})
 
-    assert profile is not None
-    call_kwargs = mock_client.fetch_profile.call_args[1]
-    assert call_kwargs["crs"] == "EPSG:4326"
+    mock_wms_cls.side_effect = capabilities
+    dov_mocks.parse.side_effect = lambda *args, **kwargs: {"layers": []}
 
+    profiles = dov_client.fetch_profiles([Point(1.0, 2.0), Point(3.0, 4.0)], fetch_elevation=True)
+
+    assert profiles == [{"layers": [], "elevation": None}, {"layers": [], "elevation": None}]
+    assert mock_wms_cls.call_count == 2
+    dov_mocks.get_elevation.assert_not_called()
+
+
+# Tests for get_profile_from_dov convenience function
 
-@patch("dovwms.dov.DOVClient")
-def test_get_profile_from_dov_error_handling(mock_client_cls):
+
+@pytest.mark.parametrize(
+    "x, y, kwargs, expected_call",
+    [
+        (247172.56, 204590.58, {}, {"fetch_elevation": True, "crs": "EPSG:31370"}),
+        (
+            6.5,
+            50.5,
+            {"crs": "EPSG:4326", "fetch_elevation": False},
+            {"fetch_elevation": False, "crs": "EPSG:4326"},
+        ),
+        (247172.56, 204590.58, {"fetch_elevation": False}, {"fetch_elevation": False, "crs": "EPSG:31370"}),
+    ],
+    ids=["defaults", "custom_crs", "without_elevation"],
+)
+def test_get_profile_from_dov(patched_client, x, y, kwargs, expected_call):
+    """Test that the convenience function queries the client at a Point and returns its profile."""
+    patched_client.fetch_profile.return_value = {"layers": [{"name": "Layer_0-10cm"}], "elevation": 45.7}
+
+    profile = get_profile_from_dov(x, y, **kwargs)
+
+    assert profile == {"layers": [{"name": "Layer_0-10cm"}], "elevation": 45.7}
+    patched_client.fetch_profile.assert_called_once_with(Point(x, y), **expected_call)
+
+
+def test_get_profile_from_dov_error_handling(patched_client):
     """Test error handling in convenience function."""
-    mock_client = Mock()
-    mock_client.fetch_profile.side_effect = Exception("Connection failed")
-    mock_client_cls.return_value = mock_client
+    patched_client.fetch_profile.side_effect = Exception("Connection failed")
 
     profile = get_profile_from_dov(247172.56, 204590.58)
 
     assert profile is None
 
 
-@patch("dovwms.dov.DOVClient")
-def test_get_profile_from_dov_point_creation(mock_client_cls):
-    """Test that coordinates are correctly converted to Point."""
-    mock_client = Mock()
-    mock_client.fetch_profile.return_value = {"layers": [{"name": "Layer_0-10cm"}]}
-    mock_client_cls.return_value = mock_client
+def test_get_profile_from_dov_caches_results(patched_client):
+    """Test that repeated queries at the same point are served from the cache."""
+    patched_client.fetch_profile.return_value = {"layers": [{"name": "Layer_0-10cm"}], "elevation": 45.7}
+
+    first = get_profile_from_dov(247172.56, 204590.58)
+    first["layers"].clear()
+    second = get_profile_from_dov(247172.56, 204590.58)
+
+    patched_client.fetch_profile.assert_called_once()
+    assert second == {"layers": [{"name": "Layer_0-10cm"}], "elevation": 45.7}
+
+
+def test_get_profile_from_dov_does_not_cache_failures(patched_client):
+    """Test that a failed fetch is retried on the next call."""
+    patched_client.fetch_profile.side_effect = [None, {"layers": []}]
+
+    assert get_profile_from_dov(247172.56, 204590.58) is None
+    assert get_profile_from_dov(247172.56, 204590.58) == {"layers": []}
+    assert patched_client.fetch_profile.call_count == 2
+
+
+def test_get_profile_from_dov_does_not_cache_missing_elevation(patched_client):
+    """Test that a profile whose elevation could not be fetched is returned but not cached."""
+    patched_client.fetch_profile.side_effect = [
+        {"layers": [], "elevation": None},
+        {"layers": [], "elevation": {"elevation": 45.7}},
+    ]
+
+    assert get_profile_from_dov(247172.56, 204590.58) == {"layers": [], "elevation": None}
+    assert get_profile_from_dov(247172.56, 204590.58) == {"layers": [], "elevation": {"elevation": 45.7}}
+    assert patched_client.fetch_profile.call_count == 2
+
+
+def test_get_profile_from_dov_reuses_client(patched_client):
+    """Test that successive calls share a single DOVClient."""
+    patched_client.fetch_profile.return_value = {"layers": []}
 
-    x, y = 247172.56, 204590.58
-    get_profile_from_dov(x, y)
+    get_profile_from_dov(247172.56, 204590.58)
+    get_profile_from_dov(6.5, 50.5, crs="EPSG:4326")
 
-    # Verify Point was created with correct coordinates
-    call_args = mock_client.fetch_profile.call_args
-    location_arg = call_args[1].get("location") or call_args[0][0]
-    assert isinstance(location_arg, Point)
-    assert location_arg.x == x
-    assert location_arg.y == y
+    dovwms.dov.DOVClient.assert_called_once_with()
+    assert patched_client.fetch_profile.call_count == 2
 
 
 # Integration-style tests (can be marked to skip in CI)
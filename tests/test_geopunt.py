@@ -1,46 +1,81 @@
-import json
-from unittest.mock import Mock, patch
+import threading
+from unittest.mock import patch
 
 import pytest
 
-from dovwms import DOVClient, get_profile_from_dov
+from dovwms import get_elevation, get_profile_from_dov
 
 
-@patch.object(DOVClient, "check_layer_exists")
-@patch.object(DOVClient, "parse_feature_info")
-@patch("dovwms.dov.get_elevation")
-def test_fetch_profile_with_elevation(mock_get_elev, mock_parse, mock_check, dov_client, sample_location):
+def test_fetch_profile_with_elevation(dov_mocks, dov_client, sample_location, empty_wms_json):
     """Test profile fetching with elevation data."""
-    mock_check.return_value = True
-    mock_parse.return_value = {"layers": [{"name": "Layer_0-10cm"}]}
+    dov_mocks.parse.return_value = {"layers": [{"name": "Layer_0-10cm"}]}
 
     # Mock elevation helper
-    mock_get_elev.return_value = 45.7
+    dov_mocks.get_elevation.return_value = 45.7
 
     # Mock WMS response
-    mock_response = Mock()
-    mock_response.read.return_value = json.dumps({"features": []})
-    dov_client.wms = Mock()
-    dov_client.wms.getfeatureinfo.return_value = mock_response
+    dov_mocks.getfeatureinfo.return_value = empty_wms_json
 
     profile = dov_client.fetch_profile(sample_location, fetch_elevation=True)
 
     assert profile["elevation"] == 45.7
-    mock_get_elev.assert_called_once_with(sample_location, "EPSG:31370")
+    dov_mocks.get_elevation.assert_called_once_with(sample_location, "EPSG:31370")
 
 
-@patch("dovwms.dov.DOVClient")
-def test_get_profile_from_dov_with_elevation(mock_client_cls):
-    """Test convenience function with elevation fetching."""
-    mock_client = Mock()
-    mock_client.fetch_profile.return_value = {"layers": [{"name": "Layer_0-10cm"}], "elevation": 45.7}
-    mock_client_cls.return_value = mock_client
+def test_fetch_profile_elevation_runs_concurrently(dov_mocks, dov_client, sample_location, empty_wms_json):
+    """Test that the elevation request is in flight while the texture request runs."""
+    dov_mocks.parse.return_value = {"layers": []}
+    elevation_started = threading.Event()
 
-    profile = get_profile_from_dov(247172.56, 204590.58, fetch_elevation=True)
+    def fake_elevation(location, crs):
+        elevation_started.set()
+        return 45.7
+
+    def fake_getfeatureinfo(template, crs, bbox):
+        # Would time out if elevation were only fetched after the texture query
+        assert elevation_started.wait(timeout=5)
+        return empty_wms_json
+
+    dov_mocks.get_elevation.side_effect = fake_elevation
+    dov_mocks.getfeatureinfo.side_effect = fake_getfeatureinfo
+
+    profile = dov_client.fetch_profile(sample_location, fetch_elevation=True)
+
+    assert profile["elevation"] == 45.7
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        ("@DHMVII_DTM_1m Stretched value;Pixel Value; 32.360001;32.360001;", 32.360001),
+        (b"@DHMVII_DTM_1m Stretched value;Pixel Value; 32.360001;32.360001;\n", 32.360001),
+        ("@DHMVII_DTM_1m Stretched value;Pixel Value; NoData;NoData;", None),
+        ("no elevation here", None),
+    ],
+)
+def test_parse_elevation_response(geopunt_client, content, expected):
+    """Test parsing elevation from text and undecoded byte responses."""
+    assert geopunt_client._parse_elevation_response(content) == expected
+
+
+@patch("dovwms.geopunt.GeopuntClient")
+def test_get_elevation_caches_results(mock_client_cls, sample_location):
+    """Test that repeated elevation queries at the same point hit the service once."""
+    mock_client_cls.return_value.fetch_elevation.return_value = {"elevation": 45.7}
+
+    assert get_elevation(sample_location) == {"elevation": 45.7}
+    assert get_elevation(sample_location) == {"elevation": 45.7}
+
+    mock_client_cls.return_value.fetch_elevation.assert_called_once()
+
+
+@patch("dovwms.geopunt.GeopuntClient")
+def test_get_elevation_does_not_cache_failures(mock_client_cls, sample_location):
+    """Test that a failed elevation fetch is retried on the next call."""
+    mock_client_cls.return_value.fetch_elevation.side_effect = [None, {"elevation": 45.7}]
 
-    # Verify fetch_elevation parameter was used
-    call_kwargs = mock_client.fetch_profile.call_args[1]
-    assert "elevation" in str(call_kwargs) or profile is not None
+    assert get_elevation(sample_location) is None
+    assert get_elevation(sample_location) == {"elevation": 45.7}
 
 
 @pytest.mark.integration